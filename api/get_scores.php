@@ -35,66 +35,137 @@ try {
     $gameSlug = isset($_GET['game']) ? sanitizeInput($_GET['game']) : null;
     $limit = isset($_GET['limit']) ? (int) $_GET['limit'] : 50;
     $offset = isset($_GET['offset']) ? (int) $_GET['offset'] : 0;
+    $window = isset($_GET['window']) ? sanitizeInput($_GET['window']) : 'all';
     
     // Validate limit (max 100 records)
     if ($limit > 100) {
         $limit = 100;
     }
     
+    // Rolling windows as days before today, must match tools/score_rollup.py
+    $windows = ['day' => 0, 'week' => 6, 'month' => 29];
+    $bucketSize = 100;
+    
+    if ($window !== 'all' && !isset($windows[$window])) {
+        throw new Exception('Invalid window. Use day, week, month or all');
+    }
+    
     // Get database instance
     $db = getDatabase();
     
-    // Build SQL query
-    $sql = "
-        SELECT 
-            id,
-            game_slug,
-            player_name,
-            score,
-            level_reached,
-            date_achieved,
-            created_at
-        FROM high_scores
-    ";
+    $validGames = ['contra', 'pacman', 'galaga', 'donkey-kong'];
+    if ($gameSlug && !in_array($gameSlug, $validGames)) {
+        throw new Exception('Invalid game slug');
+    }
     
-    $params = [];
+    $since = null;
+    $useBuckets = false;
     
-    // Add game filter if specified
-    if ($gameSlug) {
-        $validGames = ['contra', 'pacman', 'galaga', 'donkey-kong'];
-        if (!in_array($gameSlug, $validGames)) {
-            throw new Exception('Invalid game slug');
-        }
+    if ($window !== 'all') {
+        $since = date('Y-m-d', strtotime("-{$windows[$window]} days"));
+        
+        // Buckets exist only after tools/score_rollup.py build, otherwise sort the window directly
+        $tableSql = "SELECT COUNT(*) as count FROM sqlite_master WHERE type = 'table' AND name IN ('score_buckets', 'score_bucket_counts')";
+        $tableResult = $db->execute($tableSql)->fetch();
+        $useBuckets = ((int) $tableResult['count'] === 2);
         
-        $sql .= " WHERE game_slug = :game_slug";
-        $params[':game_slug'] = $gameSlug;
+        if (!$useBuckets) {
+            error_log('Score buckets missing, run tools/score_rollup.py build. Falling back to a full sort for window=' . $window);
+        }
     }
     
-    // Order by score descending
-    $sql .= " ORDER BY score DESC, date_achieved ASC";
-    
-    // Add limit and offset
-    $sql .= " LIMIT :limit OFFSET :offset";
-    $params[':limit'] = $limit;
-    $params[':offset'] = $offset;
-    
-    // Execute query
-    $stmt = $db->execute($sql, $params);
-    $scores = $stmt->fetchAll();
-    
-    // Get total count for pagination
-    $countSql = "SELECT COUNT(*) as total FROM high_scores";
-    $countParams = [];
-    
-    if ($gameSlug) {
-        $countSql .= " WHERE game_slug = :game_slug";
-        $countParams[':game_slug'] = $gameSlug;
+    if ($useBuckets) {
+        // Windowed boards merge the per-day top scores maintained by tools/score_rollup.py
+        $where = "bucket_day >= :since";
+        $params = [':since' => $since];
+        
+        if ($gameSlug) {
+            $where .= " AND game_slug = :game_slug";
+            $params[':game_slug'] = $gameSlug;
+        }
+        
+        // Buckets only hold the top scores of each day, so deeper pages are not available
+        $limit = max(0, min($limit, $bucketSize - $offset));
+        
+        $sql = "
+            SELECT 
+                score_id AS id,
+                game_slug,
+                player_name,
+                score,
+                level_reached,
+                date_achieved,
+                created_at
+            FROM score_buckets
+            WHERE {$where}
+            ORDER BY score DESC, date_achieved ASC
+            LIMIT :limit OFFSET :offset
+        ";
+        
+        $countSql = "SELECT COALESCE(SUM(total), 0) as total FROM score_bucket_counts WHERE {$where}";
+        $countParams = $params;
+        
+        $params[':limit'] = $limit;
+        $params[':offset'] = $offset;
+        
+        $scores = $db->execute($sql, $params)->fetchAll();
+        $countResult = $db->execute($countSql, $countParams)->fetch();
+        $totalScores = (int) $countResult['total'];
+        $availableScores = min($totalScores, $bucketSize);
+    } else {
+        // Build SQL query
+        $sql = "
+            SELECT 
+                id,
+                game_slug,
+                player_name,
+                score,
+                level_reached,
+                date_achieved,
+                created_at
+            FROM high_scores
+        ";
+        
+        $conditions = [];
+        $params = [];
+        
+        // Add game filter if specified
+        if ($gameSlug) {
+            $conditions[] = "game_slug = :game_slug";
+            $params[':game_slug'] = $gameSlug;
+        }
+        
+        // Add window filter when the score buckets have not been built
+        if ($since) {
+            $conditions[] = "date_achieved >= :since";
+            $params[':since'] = $since;
+        }
+        
+        $where = $conditions ? " WHERE " . implode(" AND ", $conditions) : "";
+        $sql .= $where;
+        
+        // Order by score descending
+        $sql .= " ORDER BY score DESC, date_achieved ASC";
+        
+        // Add limit and offset
+        $sql .= " LIMIT :limit OFFSET :offset";
+        $countParams = $params;
+        $params[':limit'] = $limit;
+        $params[':offset'] = $offset;
+        
+        // Execute query
+        $stmt = $db->execute($sql, $params);
+        $scores = $stmt->fetchAll();
+        
+        // Get total count for pagination
+        $countSql = "SELECT COUNT(*) as total FROM high_scores" . $where;
+        
+        $countStmt = $db->execute($countSql, $countParams);
+        $countResult = $countStmt->fetch();
+        $totalScores = $countResult['total'];
+        $availableScores = $totalScores;
     }
     
-    $countStmt = $db->execute($countSql, $countParams);
-    $countResult = $countStmt->fetch();
-    $totalScores = $countResult['total'];
-    
     // Format scores for response
     $formattedScores = array_map(function($score) {
         return [
@@ -118,9 +189,10 @@ try {
                 'total' => $totalScores,
                 'limit' => $limit,
                 'offset' => $offset,
-                'has_more' => ($offset + $limit) < $totalScores
+                'has_more' => ($offset + $limit) < $availableScores
             ],
             'game' => $gameSlug,
+            'window' => $window,
             'count' => count($formattedScores)
         ]
     ]);
@@ -0,0 +1,78 @@
+<?php
+/**
+ * Search API Endpoint
+ * Autocomplete suggestions for player names and games
+ */
+
+// CORS headers for cross-origin requests
+header('Access-Control-Allow-Origin: *');
+header('Access-Control-Allow-Methods: GET, OPTIONS');
+header('Access-Control-Allow-Headers: Content-Type');
+header('Content-Type: application/json');
+
+// Handle preflight OPTIONS request
+if ($_SERVER['REQUEST_METHOD'] === 'OPTIONS') {
+    http_response_code(204);
+    exit;
+}
+
+// Only allow GET requests
+if ($_SERVER['REQUEST_METHOD'] !== 'GET') {
+    http_response_code(405);
+    echo json_encode([
+        'success' => false,
+        'error' => 'Method not allowed. Use GET.'
+    ]);
+    exit;
+}
+
+// Include database configuration
+require_once __DIR__ . '/../config/database.php';
+require_once __DIR__ . '/../includes/functions.php';
+
+try {
+    // Get query parameters
+    $query = isset($_GET['q']) ? trim($_GET['q']) : '';
+    $limit = isset($_GET['limit']) ? (int) $_GET['limit'] : 10;
+
+    if ($query === '') {
+        throw new Exception('Missing required parameter: q');
+    }
+
+    if (strlen($query) > 50) {
+        throw new Exception('Search query too long');
+    }
+
+    // Validate limit (1-25 suggestions)
+    $limit = max(1, min($limit, 25));
+
+    $suggestions = array_map(function($row) {
+        return [
+            'kind' => $row['kind'],
+            'label' => $row['label'],
+            'game_slug' => $row['game_slug'],
+            'weight' => (int) $row['weight']
+        ];
+    }, searchSuggestions($query, $limit));
+
+    // Return success response
+    echo json_encode([
+        'success' => true,
+        'data' => [
+            'query' => $query,
+            'suggestions' => $suggestions,
+            'count' => count($suggestions)
+        ]
+    ]);
+
+} catch (Exception $e) {
+    http_response_code(400);
+    echo json_encode([
+        'success' => false,
+        'error' => $e->getMessage()
+    ]);
+
+    // Log error for debugging
+    error_log('Search error: ' . $e->getMessage());
+}
+?>
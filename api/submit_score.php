@@ -183,7 +183,9 @@ try {
     }
     
 } catch (Exception $e) {
-    http_response_code(400);
+    // Database faults are server errors so clients retry, validation failures stay 400
+    $serverErrors = ['Database connection failed', 'Database initialization failed', 'Database query failed'];
+    http_response_code(in_array($e->getMessage(), $serverErrors, true) ? 500 : 400);
     echo json_encode([
         'success' => false,
         'error' => $e->getMessage()
@@ -0,0 +1,266 @@
+<?php
+/**
+ * Sync Scores API Endpoint
+ * Receives batches of scores shipped from other arcade sites by tools/score_sync.py
+ */
+
+// CORS headers for cross-origin requests
+header('Access-Control-Allow-Origin: *');
+header('Access-Control-Allow-Methods: POST, OPTIONS');
+header('Access-Control-Allow-Headers: Content-Type, Content-Encoding, X-Sync-Secret');
+header('Content-Type: application/json');
+
+// Handle preflight OPTIONS request
+if ($_SERVER['REQUEST_METHOD'] === 'OPTIONS') {
+    http_response_code(204);
+    exit;
+}
+
+// Only allow POST requests
+if ($_SERVER['REQUEST_METHOD'] !== 'POST') {
+    http_response_code(405);
+    echo json_encode([
+        'success' => false,
+        'error' => 'Method not allowed. Use POST.'
+    ]);
+    exit;
+}
+
+// Include database configuration
+require_once __DIR__ . '/../config/database.php';
+require_once __DIR__ . '/../includes/functions.php';
+
+/**
+ * Build the idempotency key for a synced score row
+ * Must match score_idempotency_key() in tools/score_sync.py
+ * @param string $siteId Site the row originated from
+ * @param array $row Score row
+ * @return string SHA-256 hex digest
+ */
+function buildIdempotencyKey($siteId, $row) {
+    $parts = [
+        $siteId,
+        $row['game_slug'],
+        $row['player_name'],
+        (string) (int) $row['score'],
+        isset($row['level_reached']) ? (string) $row['level_reached'] : '',
+        $row['date_achieved']
+    ];
+
+    return hash('sha256', implode("\x1f", $parts));
+}
+
+/**
+ * Load the shared secret configured for a sending site
+ * Secrets live in config/sync_sites.php, see config/sync_sites.example.php
+ * @param string $siteId Site identifier
+ * @return string|null Shared secret, or null if the site is not configured
+ */
+function getSyncSiteSecret($siteId) {
+    $configPath = __DIR__ . '/../config/sync_sites.php';
+    if (!file_exists($configPath)) {
+        return null;
+    }
+
+    $sites = require $configPath;
+    if (!is_array($sites) || !isset($sites[$siteId]) || $sites[$siteId] === '') {
+        return null;
+    }
+
+    return (string) $sites[$siteId];
+}
+
+/**
+ * Check that a date string is a real Y-m-d date
+ * @param mixed $date Date string
+ * @return bool True if valid
+ */
+function isValidScoreDate($date) {
+    if (!is_string($date)) {
+        return false;
+    }
+
+    $parsed = DateTime::createFromFormat('!Y-m-d', $date);
+    return $parsed !== false && $parsed->format('Y-m-d') === $date;
+}
+
+try {
+    // Get input data, batches are normally gzip-compressed
+    $input = file_get_contents('php://input');
+
+    $encoding = isset($_SERVER['HTTP_CONTENT_ENCODING']) ? strtolower($_SERVER['HTTP_CONTENT_ENCODING']) : '';
+    if ($encoding === 'gzip') {
+        $input = gzdecode($input);
+        if ($input === false) {
+            throw new Exception('Invalid gzip payload');
+        }
+    }
+
+    $data = json_decode($input, true);
+
+    if (json_last_error() !== JSON_ERROR_NONE) {
+        throw new Exception('Invalid JSON data');
+    }
+
+    if (!isset($data['site_id']) || empty($data['site_id'])) {
+        throw new Exception('Missing required field: site_id');
+    }
+
+    if (!isset($data['rows']) || !is_array($data['rows'])) {
+        throw new Exception('Missing required field: rows');
+    }
+
+    if (!is_string($data['site_id'])) {
+        throw new Exception('Invalid site_id');
+    }
+
+    $siteId = sanitizeInput($data['site_id']);
+    if (!preg_match('/^[A-Za-z0-9\-_\.]{1,50}$/', $siteId)) {
+        throw new Exception('Invalid site_id');
+    }
+
+    // Only configured sites may write scores, each with its own shared secret
+    $secret = getSyncSiteSecret($siteId);
+    $providedSecret = isset($_SERVER['HTTP_X_SYNC_SECRET']) ? (string) $_SERVER['HTTP_X_SYNC_SECRET'] : '';
+
+    if ($secret === null || !hash_equals($secret, $providedSecret)) {
+        http_response_code(403);
+        echo json_encode([
+            'success' => false,
+            'error' => 'Unknown site or invalid sync secret'
+        ]);
+        error_log('Score sync rejected: bad credentials for site ' . $siteId);
+        exit;
+    }
+
+    // Same rules as api/submit_score.php
+    $validGames = ['contra', 'pacman', 'galaga', 'donkey-kong'];
+
+    $maxScores = [
+        'contra' => 10000000,      // 10 million max
+        'pacman' => 5000000,       // 5 million max
+        'galaga' => 3000000,       // 3 million max
+        'donkey-kong' => 2000000   // 2 million max
+    ];
+
+    $accepted = 0;
+    $duplicates = 0;
+    $rejected = [];
+    $highWaterMark = 0;
+
+    // Get database instance
+    $db = getDatabase();
+
+    // Begin transaction so a batch is applied all-or-nothing
+    $db->beginTransaction();
+
+    try {
+        $keySql = "
+            INSERT OR IGNORE INTO score_sync_keys (idempotency_key, site_id, remote_id, score_id)
+            VALUES (:idempotency_key, :site_id, :remote_id, 0)
+        ";
+
+        $scoreSql = "
+            INSERT INTO high_scores (game_slug, player_name, score, level_reached, date_achieved)
+            VALUES (:game_slug, :player_name, :score, :level_reached, :date_achieved)
+        ";
+
+        $linkSql = "UPDATE score_sync_keys SET score_id = :score_id WHERE idempotency_key = :idempotency_key";
+
+        foreach ($data['rows'] as $row) {
+            $remoteId = (is_array($row) && isset($row['id']) && is_numeric($row['id'])) ? (int) $row['id'] : 0;
+            $highWaterMark = max($highWaterMark, $remoteId);
+
+            // Skip malformed rows or rows that would never be accepted, the sender still moves past them
+            if (!is_array($row)
+                || !isset($row['game_slug'], $row['player_name'], $row['score'], $row['date_achieved'], $row['idempotency_key'])
+                || !in_array($row['game_slug'], $validGames, true)
+                || !is_string($row['player_name'])
+                || !is_numeric($row['score'])
+                || !is_string($row['idempotency_key'])
+                || (isset($row['level_reached']) && !is_string($row['level_reached']) && !is_int($row['level_reached']))) {
+                $rejected[] = $remoteId;
+                continue;
+            }
+
+            $playerName = sanitizeInput($row['player_name']);
+            $score = (int) $row['score'];
+            $levelReached = isset($row['level_reached']) ? sanitizeInput((string) $row['level_reached']) : null;
+
+            if (strlen($playerName) < 1 || strlen($playerName) > 20
+                || !preg_match('/^[A-Za-z0-9\s\-_\.]+$/', $playerName)
+                || $score <= 0
+                || $score > $maxScores[$row['game_slug']]
+                || ($levelReached !== null && strlen($levelReached) > 20)
+                || !isValidScoreDate($row['date_achieved'])) {
+                $rejected[] = $remoteId;
+                continue;
+            }
+
+            $key = buildIdempotencyKey($siteId, $row);
+            if (!hash_equals($key, (string) $row['idempotency_key'])) {
+                $rejected[] = $remoteId;
+                continue;
+            }
+
+            // Claim the key first; an ignored insert means we already have this score
+            $keyStmt = $db->execute($keySql, [
+                ':idempotency_key' => $key,
+                ':site_id' => $siteId,
+                ':remote_id' => $remoteId
+            ]);
+
+            if ($keyStmt->rowCount() === 0) {
+                $duplicates++;
+                continue;
+            }
+
+            $db->execute($scoreSql, [
+                ':game_slug' => $row['game_slug'],
+                ':player_name' => $playerName,
+                ':score' => $score,
+                ':level_reached' => $levelReached,
+                ':date_achieved' => $row['date_achieved']
+            ]);
+
+            $db->execute($linkSql, [
+                ':score_id' => $db->lastInsertId(),
+                ':idempotency_key' => $key
+            ]);
+
+            $accepted++;
+        }
+
+        // Commit transaction
+        $db->commit();
+
+    } catch (Exception $e) {
+        // Rollback transaction on error
+        $db->rollback();
+        throw $e;
+    }
+
+    // Return success response, the sender stores high_water_mark for this peer
+    echo json_encode([
+        'success' => true,
+        'data' => [
+            'site_id' => $siteId,
+            'received' => count($data['rows']),
+            'accepted' => $accepted,
+            'duplicates' => $duplicates,
+            'rejected' => $rejected,
+            'high_water_mark' => $highWaterMark
+        ]
+    ]);
+
+} catch (Exception $e) {
+    http_response_code(400);
+    echo json_encode([
+        'success' => false,
+        'error' => $e->getMessage()
+    ]);
+
+    // Log error for debugging
+    error_log('Score sync error: ' . $e->getMessage());
+}
+?>
@@ -92,7 +92,20 @@ class Database {
             $conn->exec("CREATE INDEX IF NOT EXISTS idx_game_slug ON high_scores(game_slug)");
             $conn->exec("CREATE INDEX IF NOT EXISTS idx_score ON high_scores(score DESC)");
             $conn->exec("CREATE INDEX IF NOT EXISTS idx_date ON high_scores(date_achieved DESC)");
-            
+
+            // Create sync keys table (idempotency keys for scores received from other sites)
+            $conn->exec("
+                CREATE TABLE IF NOT EXISTS score_sync_keys (
+                    idempotency_key CHAR(64) PRIMARY KEY,
+                    site_id VARCHAR(50) NOT NULL,
+                    remote_id INTEGER NOT NULL,
+                    score_id INTEGER NOT NULL,
+                    received_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            ");
+
+            $conn->exec("CREATE INDEX IF NOT EXISTS idx_sync_site ON score_sync_keys(site_id, remote_id DESC)");
+
             // Insert default games if table is empty
             $this->insertDefaultGames();
             
@@ -0,0 +1,11 @@
+<?php
+/**
+ * Sync Site Secrets for api/sync_scores.php
+ * Copy to config/sync_sites.php and give each sending site its own secret.
+ * The sync agent sends the secret in the X-Sync-Secret header.
+ */
+
+return [
+    // 'arcade-east' => 'replace-with-a-long-random-secret',
+];
+?>
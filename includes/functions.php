@@ -392,6 +392,75 @@ function searchGames($query) {
     }
 }
 
+/**
+ * Autocomplete players, games and developers from the search index
+ * The index is built and refreshed by tools/search_index.py
+ * @param string $query Search text
+ * @param int $limit Maximum number of suggestions
+ * @return array Array of suggestions (kind, label, game_slug, weight)
+ */
+function searchSuggestions($query, $limit = 10) {
+    try {
+        $query = trim($query);
+        if ($query === '') {
+            return [];
+        }
+
+        $conn = Database::getInstance()->getConnection();
+
+        // Prefix matches use the NOCASE label index
+        $stmt = $conn->prepare("
+            SELECT id, kind, label, game_slug, weight
+            FROM search_entries
+            WHERE label >= :prefix AND label < :prefix_end
+            ORDER BY label
+            LIMIT :limit
+        ");
+        $stmt->bindValue(':prefix', $query, PDO::PARAM_STR);
+        $stmt->bindValue(':prefix_end', $query . "\u{10FFFF}", PDO::PARAM_STR);
+        $stmt->bindValue(':limit', $limit, PDO::PARAM_INT);
+        $stmt->execute();
+        $results = $stmt->fetchAll();
+
+        // Fall back to trigram substring matches (needs at least three characters)
+        if (count($results) < $limit && strlen($query) >= 3) {
+            // Without FTS5 trigram support in PHP's SQLite, keep the prefix matches
+            try {
+                $seen = array_column($results, 'id');
+
+                $stmt = $conn->prepare("
+                    SELECT e.id, e.kind, e.label, e.game_slug, e.weight
+                    FROM search_fts
+                    JOIN search_entries e ON e.id = search_fts.rowid
+                    WHERE search_fts MATCH :phrase
+                    ORDER BY e.weight DESC
+                    LIMIT :limit
+                ");
+                $stmt->bindValue(':phrase', '"' . str_replace('"', '""', $query) . '"', PDO::PARAM_STR);
+                $stmt->bindValue(':limit', $limit, PDO::PARAM_INT);
+                $stmt->execute();
+
+                foreach ($stmt->fetchAll() as $row) {
+                    if (count($results) >= $limit) {
+                        break;
+                    }
+                    if (!in_array($row['id'], $seen)) {
+                        $results[] = $row;
+                    }
+                }
+            } catch (Exception $e) {
+                error_log('Error searching substring suggestions: ' . $e->getMessage());
+            }
+        }
+
+        return $results;
+
+    } catch (Exception $e) {
+        error_log('Error searching suggestions: ' . $e->getMessage());
+        return [];
+    }
+}
+
 /**
  * Get default games data (fallback when database is empty)
  * @return array Default games array
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Score Event Benchmark
+Compares the loose dict-plus-json score path against ScoreEvent and its codecs.
+Reports CPU time, allocations and retained memory per event, and GC collections.
+"""
+
+import gc
+import sys
+import json
+import time
+import random
+import argparse
+import tracemalloc
+
+from score_event import ScoreEvent, ScoreEventBatch, format_timestamp
+
+
+def make_lines(count, seed=0):
+    """Build highscores.jsonl lines in the shapes written by the Lua modules."""
+    rng = random.Random(seed)
+    base = 1753790000
+    lines = []
+    for i in range(count):
+        initials = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(3))
+        timestamp = format_timestamp(base + i)
+        if i % 2:
+            # donkeykong.lua: every value passed through tostring()
+            record = {"game": "Donkey Kong (NES)", "initials": initials,
+                      "score": str(rng.randrange(100, 999999, 100)), "timestamp": timestamp}
+        else:
+            record = {"game": "Contra (NES)", "initials": initials,
+                      "score": rng.randrange(100, 9999999, 100), "timestamp": timestamp}
+        lines.append(json.dumps(record))
+    return lines
+
+
+def dict_pipeline(lines):
+    """Current path: parse, then re-serialize and re-parse at every hop."""
+    archive = []
+    for line in lines:
+        record = json.loads(line)
+        queued = json.dumps(record)                      # watcher -> queue
+        record = json.loads(queued)                      # queue -> submitter
+        json.dumps(record)                               # HTTP payload
+        archive.append(json.loads(json.dumps(record)))   # archive write/read
+    return archive
+
+
+def event_pipeline(lines):
+    """ScoreEvent path: normalize once, binary codec for queue and archive."""
+    batch = ScoreEventBatch()
+    for line in lines:
+        event = ScoreEvent.from_json_line(line)
+        event = ScoreEvent.decode(event.encode())        # watcher -> queue -> submitter
+        json.dumps(event.to_payload())                   # HTTP payload
+        batch.append(event)
+    return ScoreEventBatch.decode(batch.encode())        # archive write/read
+
+
+def measure(name, func, lines):
+    """Run one pipeline and collect timing, allocation and GC figures."""
+    gc.collect()
+    collections_before = sum(stat["collections"] for stat in gc.get_stats())
+
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    result = func(lines)
+    cpu = time.process_time() - start_cpu
+    wall = time.perf_counter() - start_wall
+
+    collections = sum(stat["collections"] for stat in gc.get_stats()) - collections_before
+
+    # Allocation figures come from a second, traced run
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = func(lines)
+    retained, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    del result
+
+    count = len(lines)
+    return {
+        "name": name,
+        "cpu_us_per_event": cpu / count * 1e6,
+        "wall_us_per_event": wall / count * 1e6,
+        "gc_collections": collections,
+        "peak_bytes_per_event": peak / count,
+        "retained_bytes_per_event": retained / count,
+        "retained_blocks_per_event": blocks / count,
+    }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the ScoreEvent codec against dicts and json.")
+    parser.add_argument("--events", type=int, default=50000, help="Number of events to replay")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    lines = make_lines(args.events)
+
+    # Both pipelines must agree before their numbers mean anything
+    expected = [ScoreEvent.from_json_line(line) for line in lines]
+    if list(event_pipeline(lines)) != expected:
+        print("✗ ScoreEvent round trip does not match the source records")
+        sys.exit(1)
+
+    results = [
+        measure("dict + json", dict_pipeline, lines),
+        measure("ScoreEvent", event_pipeline, lines),
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"📊 Replaying {args.events:,} events through queue, HTTP payload and archive hops")
+    print(f"{'':<14}{'CPU us/ev':>11}{'peak B/ev':>11}{'kept B/ev':>11}{'kept obj/ev':>13}{'GC runs':>9}")
+    for r in results:
+        print(f"{r['name']:<14}{r['cpu_us_per_event']:>11.2f}{r['peak_bytes_per_event']:>11.0f}"
+              f"{r['retained_bytes_per_event']:>11.0f}{r['retained_blocks_per_event']:>13.2f}"
+              f"{r['gc_collections']:>9}")
+
+
+if __name__ == "__main__":
+    main()
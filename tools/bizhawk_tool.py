@@ -41,16 +41,40 @@ except ImportError:
     print("pip install plyer")
     sys.exit(1)
 
+# Score model, ships alongside this script in tools/
+try:
+    from score_event import ScoreEvent, format_timestamp
+except ImportError:
+    print("Missing score_event.py. Please copy it next to bizhawk_tool.py:")
+    print("tools/score_event.py must ship together with tools/bizhawk_tool.py")
+    sys.exit(1)
+
+
+# Results of submit_to_api: rejected scores are skipped, failed ones are retried
+SUBMIT_OK = "ok"
+SUBMIT_REJECTED = "rejected"
+SUBMIT_FAILED = "failed"
+
+# Seconds to wait before retrying scores the API could not be reached for
+SUBMIT_RETRY_DELAY = 30
+
+# Errors api/submit_score.php reports for server faults; older servers send them with a 400
+SERVER_ERRORS = ("Database connection failed", "Database initialization failed", "Database query failed")
+
 
 class GameFileWatcher(FileSystemEventHandler):
     """File system event handler for watching game-related file changes."""
 
-    def __init__(self, api_url, download_callback=None, score_callback=None):
+    def __init__(self, api_url, download_callback=None, score_callback=None, state_path=None):
         super().__init__()
         self.api_url = api_url
         self.download_callback = download_callback
         self.score_callback = score_callback
         self.last_modified = {}
+        self.state_path = Path(state_path) if state_path else None
+        self.read_offsets = self.load_offsets()
+        self.score_lock = threading.Lock()
+        self.retry_timers = {}
 
     def on_modified(self, event):
         if event.is_directory:
@@ -69,16 +93,8 @@ class GameFileWatcher(FileSystemEventHandler):
             print(f"🎮 Current game file changed: {event.src_path}")
             self.process_current_game(event.src_path)
 
-        # Handle highscores.json changes
+        # Handle highscores.jsonl changes (no debounce, only new lines are read)
         elif event.src_path.endswith('highscores.jsonl'):
-            # Debounce rapid file changes
-            current_time = time.time()
-            if event.src_path in self.last_modified:
-                if current_time - self.last_modified[event.src_path] < 1:
-                    return
-
-            self.last_modified[event.src_path] = current_time
-
             print(f"📊 High score file changed: {event.src_path}")
             self.process_high_score(event.src_path)
 
@@ -117,65 +133,134 @@ class GameFileWatcher(FileSystemEventHandler):
             print(f"✗ Error processing current_game file: {e}")
             self.show_notification("❌ Error", f"Failed to process game file: {str(e)}")
 
-    def process_high_score(self, file_path):
-        """Process the high score file and submit to API."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                score_data = json.load(f)
-
-            print(f"🎮 New high score detected:")
-            print(f"   Game: {score_data.get('game', 'Unknown')}")
-            print(f"   Score: {score_data.get('score', 0)}")
-            print(f"   Initials: {score_data.get('initials', 'N/A')}")
-            print(f"   Time: {score_data.get('timestamp', 'Unknown')}")
-
-            # Submit to API
-            success = self.submit_to_api(score_data)
-
-            if success:
-                self.show_notification("High Score Submitted!", 
-                                     f"{score_data.get('game', 'Game')}: {score_data.get('score', 0)} points")
-            else:
-                self.show_notification("Submission Failed", 
-                                     "Could not submit high score to API")
+    def load_offsets(self):
+        """Load the high score file read offsets saved by a previous run."""
+        if not self.state_path or not self.state_path.exists():
+            return {}
 
-            # Call callback if provided
-            if self.score_callback:
-                self.score_callback(score_data, success)
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return {path: int(offset) for path, offset in json.load(f).get("read_offsets", {}).items()}
+        except (IOError, ValueError, AttributeError) as e:
+            print(f"⚠ Could not read tracker state, starting from scratch: {e}")
+            return {}
+
+    def save_offsets(self):
+        """Atomically write the high score file read offsets."""
+        if not self.state_path:
+            return
 
-        except Exception as e:
-            print(f"✗ Error processing high score file: {e}")
-            self.show_notification("Error", f"Failed to process high score: {str(e)}")
+        tmp_path = self.state_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"read_offsets": self.read_offsets}, f, indent=2)
+            os.replace(tmp_path, self.state_path)
+        except IOError as e:
+            print(f"⚠ Could not save tracker state: {e}")
+
+    def resume_scores(self, file_path):
+        """Submit scores written since the last run, or start from the end on the first run."""
+        file_path = str(file_path)
+        if file_path in self.read_offsets:
+            if os.path.exists(file_path):
+                self.process_high_score(file_path)
+            return
 
-    def process_high_score(self, file_path):
-        """Process the high score file and submit to API."""
+        # First run: lines already in the file were never tracked, so they are not sent
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                score_data = json.load(f)
+            self.read_offsets[file_path] = os.path.getsize(file_path)
+        except OSError:
+            self.read_offsets[file_path] = 0
+        self.save_offsets()
+
+    def read_new_lines(self, file_path):
+        """Read complete lines after the last handed-off line.
+
+        Returns (line, end_offset) pairs. The offset is only moved by
+        process_high_score once a line has been submitted or rejected.
+        """
+        offset = self.read_offsets.get(file_path, 0)
+        if os.path.getsize(file_path) < offset:
+            offset = 0  # File was truncated or replaced
+
+        with open(file_path, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+
+        # Leave a partially written last line for the next change event
+        lines = []
+        start = 0
+        while True:
+            end = data.find(b"\n", start) + 1
+            if not end:
+                break
+            lines.append((data[start:end], offset + end))
+            start = end
+        return lines
 
-            print(f"🎮 New high score detected:")
-            print(f"   Game: {score_data.get('game', 'Unknown')}")
-            print(f"   Score: {score_data.get('score', 0)}")
-            print(f"   Initials: {score_data.get('initials', 'N/A')}")
-            print(f"   Time: {score_data.get('timestamp', 'Unknown')}")
+    def process_high_score(self, file_path):
+        """Process new lines in the high score file and submit them to the API."""
+        with self.score_lock:
+            self.retry_timers.pop(file_path, None)
+            try:
+                lines = self.read_new_lines(file_path)
+            except OSError as e:
+                print(f"✗ Error processing high score file: {e}")
+                self.show_notification("Error", f"Failed to process high score: {str(e)}")
+                return
+
+            for line, end_offset in lines:
+                if line.strip():
+                    try:
+                        event = ScoreEvent.from_json_line(line)
+                    except (ValueError, TypeError) as e:
+                        print(f"✗ Skipping invalid high score line: {e}")
+                        event = None
+
+                    if event and not self.submit_score(event):
+                        # Keep the offset before this line so it is sent again
+                        self.schedule_retry(file_path)
+                        break
+
+                self.read_offsets[file_path] = end_offset
+                self.save_offsets()
+
+    def submit_score(self, event):
+        """Submit one score. Returns False if it should be retried later."""
+        print(f"🎮 New high score detected:")
+        print(f"   Game: {event.game_slug}")
+        print(f"   Score: {event.score}")
+        print(f"   Initials: {event.initials}")
+        print(f"   Time: {format_timestamp(event.timestamp)}")
+
+        # Submit to API
+        result = self.submit_to_api(event.to_payload())
+
+        if result == SUBMIT_OK:
+            self.show_notification("High Score Submitted!",
+                                 f"{event.game_slug}: {event.score} points")
+        elif result == SUBMIT_REJECTED:
+            self.show_notification("Score Rejected",
+                                 f"The API did not accept the {event.game_slug} score")
+        else:
+            self.show_notification("Submission Failed",
+                                 f"Could not reach the API, retrying in {SUBMIT_RETRY_DELAY}s")
 
-            # Submit to API
-            success = self.submit_to_api(score_data)
+        # Call callback if provided
+        if self.score_callback:
+            self.score_callback(event, result == SUBMIT_OK)
 
-            if success:
-                self.show_notification("High Score Submitted!", 
-                                     f"{score_data.get('game', 'Game')}: {score_data.get('score', 0)} points")
-            else:
-                self.show_notification("Submission Failed", 
-                                     "Could not submit high score to API")
+        return result != SUBMIT_FAILED
 
-            # Call callback if provided
-            if self.callback:
-                self.callback(score_data, success)
+    def schedule_retry(self, file_path):
+        """Process the high score file again after SUBMIT_RETRY_DELAY seconds."""
+        if file_path in self.retry_timers:
+            return
 
-        except Exception as e:
-            print(f"✗ Error processing high score file: {e}")
-            self.show_notification("Error", f"Failed to process high score: {str(e)}")
+        timer = threading.Timer(SUBMIT_RETRY_DELAY, self.process_high_score, args=(file_path,))
+        timer.daemon = True
+        self.retry_timers[file_path] = timer
+        timer.start()
 
     def submit_to_api(self, score_data):
         """Submit score data to the API."""
@@ -184,10 +269,23 @@ class GameFileWatcher(FileSystemEventHandler):
             response = requests.post(self.api_url, json=score_data, timeout=10)
             response.raise_for_status()
             print("✓ Successfully submitted to API")
-            return True
+            return SUBMIT_OK
+        except requests.HTTPError as e:
+            # Only a 400 validation error means sending the score again will not help;
+            # 408, 429, 5xx and anything unrecognized are retried
+            if e.response is not None and e.response.status_code == 400:
+                try:
+                    error = e.response.json().get("error", "")
+                except (ValueError, AttributeError):
+                    error = ""
+                if error and error not in SERVER_ERRORS:
+                    print(f"✗ API rejected score: {error}")
+                    return SUBMIT_REJECTED
+            print(f"✗ API submission failed: {e}")
+            return SUBMIT_FAILED
         except requests.RequestException as e:
             print(f"✗ API submission failed: {e}")
-            return False
+            return SUBMIT_FAILED
 
     def show_notification(self, title, message):
         """Show desktop notification."""
@@ -280,12 +378,12 @@ class BizHawkTool:
 
     def start_file_watcher(self):
         """Start watching for current_game and highscores.json changes."""
-        def score_callback(score_data, success):
+        def score_callback(event, success):
             """Callback when a score is processed."""
             if success:
-                print(f"✅ Score successfully submitted for {score_data.get('game', 'Unknown')}")
+                print(f"✅ Score successfully submitted for {event.game_slug}")
             else:
-                print(f"❌ Failed to submit score for {score_data.get('game', 'Unknown')}")
+                print(f"❌ Failed to submit score for {event.game_slug}")
 
         def download_callback(game_name):
             """Callback when a new game is detected."""
@@ -294,8 +392,10 @@ class BizHawkTool:
         event_handler = GameFileWatcher(
             self.api_url, 
             download_callback=download_callback,
-            score_callback=score_callback
+            score_callback=score_callback,
+            state_path=self.lua_nes_dir / 'tracker_state.json'
         )
+        event_handler.resume_scores(self.lua_nes_dir / 'highscores.jsonl')
         self.observer = Observer()
         self.observer.schedule(event_handler, str(self.lua_nes_dir), recursive=False)
         self.observer.start()
@@ -655,11 +755,24 @@ class BizHawkTool:
                         "level": "0x0760"
                     }
                 },
+                "Contra": {
+                    "system": "NES",
+                    "ram_mappings": {
+                        "score": "0x07E2",
+                        "score_encoding": "u16le",
+                        "score_multiplier": 100,
+                        "lives": "0x0032",
+                        "game_over": "0x0038",
+                        "capture_delay": 10
+                    }
+                },
                 "Donkey Kong": {
-                    "system": "NES", 
+                    "system": "NES",
                     "ram_mappings": {
-                        "score": "0x6000",
-                        "lives": "0x6005"
+                        "score": "0x0025",
+                        "score_encoding": "bcd",
+                        "score_bytes": 3,
+                        "game_over": "0x0406"
                     }
                 },
                 "Pac-Man": {
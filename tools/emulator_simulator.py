@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+BizHawk Emulator Simulator
+Soak-tests the high score tracker without running real BizHawk instances.
+Features: N fake emulators, configurable score rates and bursts, a stand-in API,
+and a report of lost, duplicated and late scores plus tracker CPU and memory use.
+"""
+
+import sys
+import json
+import time
+import random
+import string
+import argparse
+import tempfile
+import threading
+import multiprocessing
+from pathlib import Path
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# The tracker under test
+try:
+    from watchdog.observers import Observer
+    from bizhawk_tool import GameFileWatcher
+    from score_event import game_slug_for
+except ImportError:
+    print("Could not import the tracker. Run from the tools directory and install:")
+    print("pip install requests pystray pillow watchdog plyer")
+    sys.exit(1)
+
+# Process metrics (optional, falls back to resource usage on exit)
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+# Record shapes written by modules/score/*.lua
+GAME_PROFILES = {
+    "contra": {
+        "rom_name": "Contra",
+        "game": "Contra (NES)",
+        "score_step": 100,
+        "string_values": False,
+    },
+    "donkey-kong": {
+        "rom_name": "Donkey Kong",
+        "game": "Donkey Kong (NES)",
+        "score_step": 100,
+        "string_values": True,
+    },
+}
+
+BURST_PATTERNS = ["steady", "burst", "random"]
+
+
+def instance_initials(index):
+    """Encode an instance index as three letters (AAA, AAB, ...)."""
+    letters = string.ascii_uppercase
+    return letters[(index // 676) % 26] + letters[(index // 26) % 26] + letters[index % 26]
+
+
+def get_iso_timestamp():
+    """Timestamp in the format written by the Lua score modules."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000000Z")
+
+
+def score_key(record):
+    """Identify a score record independent of how its values were encoded.
+
+    Works for both the Lua record shape ("game") and the submitted payload ("game_slug").
+    """
+    game = game_slug_for(record.get("game_slug") or record.get("game"))
+    return (game, str(record.get("initials")), int(record.get("score", 0)))
+
+
+class StandInAPI:
+    """Local HTTP server that imitates api/submit_score.php and records every submission."""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.received = []
+        self.lock = threading.Lock()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+                try:
+                    record = json.loads(body)
+                except ValueError:
+                    record = None
+                with api.lock:
+                    api.received.append((time.time(), record))
+
+                response = json.dumps({"success": True}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/api/submit_score.php"
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def snapshot(self):
+        with self.lock:
+            return list(self.received)
+
+
+class SimulatedEmulator(threading.Thread):
+    """Imitates one BizHawk instance writing current_game.txt and highscores.jsonl."""
+
+    def __init__(self, index, lua_nes_dir, game_slug, rate, pattern, burst_size, duration, seed):
+        super().__init__(daemon=True)
+        self.index = index
+        self.lua_nes_dir = Path(lua_nes_dir)
+        self.profile = GAME_PROFILES[game_slug]
+        self.rate = rate
+        self.pattern = pattern
+        self.burst_size = burst_size
+        self.duration = duration
+        self.random = random.Random(seed)
+        self.initials = instance_initials(index)
+        self.written = []
+
+    def write_current_game(self):
+        with open(self.lua_nes_dir / "current_game.txt", "w", encoding="utf-8") as f:
+            f.write(self.profile["rom_name"])
+
+    def append_score(self, seq):
+        """Append one record, unique per instance through its initials and score."""
+        score = (seq + 1) * self.profile["score_step"]
+        record = {
+            "game": self.profile["game"],
+            "initials": self.initials,
+            "score": score,
+            "timestamp": get_iso_timestamp(),
+        }
+        if self.profile["string_values"]:
+            # donkeykong.lua writes every value with tostring()
+            record = {k: str(v) for k, v in record.items()}
+
+        with open(self.lua_nes_dir / "highscores.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        self.written.append((time.time(), score_key(record)))
+
+    def next_delay(self, seq):
+        """Seconds to wait before the next record for the configured pattern."""
+        interval = 1.0 / self.rate
+        if self.pattern == "steady":
+            return interval
+        if self.pattern == "burst":
+            # burst_size records back to back, then a pause that keeps the average rate
+            if (seq + 1) % self.burst_size:
+                return 0.0
+            return interval * self.burst_size
+        return self.random.expovariate(self.rate)
+
+    def run(self):
+        self.lua_nes_dir.mkdir(parents=True, exist_ok=True)
+        self.write_current_game()
+
+        deadline = time.time() + self.duration
+        seq = 0
+        while time.time() < deadline:
+            self.append_score(seq)
+            delay = self.next_delay(seq)
+            seq += 1
+            if delay:
+                time.sleep(delay)
+
+
+class SilentGameFileWatcher(GameFileWatcher):
+    """Tracker watcher with desktop notifications disabled for soak runs."""
+
+    def show_notification(self, title, message):
+        pass
+
+
+def run_tracker(lua_nes_dirs, api_url, ready, stop):
+    """Run the tracker's file watchers in a child process until stop is set."""
+    observer = Observer()
+    for lua_nes_dir in lua_nes_dirs:
+        observer.schedule(SilentGameFileWatcher(api_url), str(lua_nes_dir), recursive=False)
+    observer.start()
+    ready.set()
+    try:
+        stop.wait()
+    finally:
+        observer.stop()
+        observer.join()
+
+
+class TrackerMonitor(threading.Thread):
+    """Samples CPU and memory of the tracker process while the soak runs."""
+
+    def __init__(self, pid, interval=0.5):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.process = psutil.Process(pid) if psutil else None
+        self.samples = []
+        self.running = True
+
+    def run(self):
+        if not self.process:
+            return
+        self.process.cpu_percent(None)
+        while self.running:
+            time.sleep(self.interval)
+            try:
+                cpu = self.process.cpu_percent(None)
+                rss = self.process.memory_info().rss
+            except psutil.Error:
+                break
+            self.samples.append((cpu, rss))
+
+    def stop(self):
+        self.running = False
+        self.join()
+
+
+class SoakTest:
+    """Wires emulators, the tracker and the stand-in API together and reports results."""
+
+    def __init__(self, instances, games, rate, pattern, burst_size, duration, drain,
+                 late_after, work_dir, seed):
+        self.instances = instances
+        self.games = games
+        self.rate = rate
+        self.pattern = pattern
+        self.burst_size = burst_size
+        self.duration = duration
+        self.drain = drain
+        self.late_after = late_after
+        self.work_dir = Path(work_dir)
+        self.seed = seed
+
+    def run(self):
+        api = StandInAPI()
+        api.start()
+        print(f"🌐 Stand-in API listening on {api.url}")
+
+        emulators = [
+            SimulatedEmulator(
+                index=i,
+                lua_nes_dir=self.work_dir / f"instance_{i:04d}" / "Lua" / "NES",
+                game_slug=self.games[i % len(self.games)],
+                rate=self.rate,
+                pattern=self.pattern,
+                burst_size=self.burst_size,
+                duration=self.duration,
+                seed=self.seed + i
+            )
+            for i in range(self.instances)
+        ]
+        for emulator in emulators:
+            emulator.lua_nes_dir.mkdir(parents=True, exist_ok=True)
+
+        ready = multiprocessing.Event()
+        stop = multiprocessing.Event()
+        tracker = multiprocessing.Process(
+            target=run_tracker,
+            args=([e.lua_nes_dir for e in emulators], api.url, ready, stop)
+        )
+        tracker.start()
+        ready.wait(timeout=30)
+
+        monitor = TrackerMonitor(tracker.pid)
+        monitor.start()
+
+        print(f"🎮 Starting {self.instances} emulators ({self.pattern}, {self.rate}/s each) "
+              f"for {self.duration}s...")
+        for emulator in emulators:
+            emulator.start()
+        for emulator in emulators:
+            emulator.join()
+
+        print(f"⏳ Draining for {self.drain}s...")
+        time.sleep(self.drain)
+
+        monitor.stop()
+        stop.set()
+        tracker.join(timeout=30)
+        api.stop()
+
+        usage = None
+        if resource and not psutil:
+            usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+        return self.report(emulators, api.snapshot(), monitor.samples, usage)
+
+    def report(self, emulators, received, samples, usage):
+        """Print and return lost, duplicated and late counts plus tracker resource use."""
+        written = {}
+        for emulator in emulators:
+            for written_at, key in emulator.written:
+                written[key] = written_at
+
+        arrivals = {}
+        unknown = 0
+        for received_at, record in received:
+            try:
+                key = score_key(record)
+            except (AttributeError, TypeError, ValueError):
+                unknown += 1
+                continue
+            if key not in written:
+                unknown += 1
+                continue
+            arrivals.setdefault(key, []).append(received_at)
+
+        lost = [key for key in written if key not in arrivals]
+        duplicated = [key for key, times in arrivals.items() if len(times) > 1]
+        latencies = sorted(min(times) - written[key] for key, times in arrivals.items())
+        late = [latency for latency in latencies if latency > self.late_after]
+
+        def percentile(values, pct):
+            if not values:
+                return 0.0
+            return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+        results = {
+            "written": len(written),
+            "delivered": len(arrivals),
+            "lost": len(lost),
+            "duplicated": len(duplicated),
+            "late": len(late),
+            "unknown": unknown,
+            "latency_p50": percentile(latencies, 50),
+            "latency_p95": percentile(latencies, 95),
+            "latency_max": latencies[-1] if latencies else 0.0,
+        }
+
+        if samples:
+            results["cpu_avg_percent"] = sum(cpu for cpu, _ in samples) / len(samples)
+            results["cpu_max_percent"] = max(cpu for cpu, _ in samples)
+            results["rss_max_mb"] = max(rss for _, rss in samples) / (1024 * 1024)
+        elif usage:
+            results["cpu_seconds"] = usage.ru_utime + usage.ru_stime
+            # ru_maxrss is kilobytes on Linux and bytes on macOS
+            divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+            results["rss_max_mb"] = usage.ru_maxrss / divisor
+
+        print("\n" + "=" * 60)
+        print("Soak Test Results")
+        print("=" * 60)
+        print(f"  Written:     {results['written']}")
+        print(f"  Delivered:   {results['delivered']}")
+        print(f"  Lost:        {results['lost']}")
+        print(f"  Duplicated:  {results['duplicated']}")
+        print(f"  Late (>{self.late_after}s): {results['late']}")
+        print(f"  Unknown:     {results['unknown']}")
+        print(f"  Latency p50/p95/max: {results['latency_p50']:.3f}s / "
+              f"{results['latency_p95']:.3f}s / {results['latency_max']:.3f}s")
+        if "cpu_avg_percent" in results:
+            print(f"  Tracker CPU: {results['cpu_avg_percent']:.1f}% avg, "
+                  f"{results['cpu_max_percent']:.1f}% peak")
+        elif "cpu_seconds" in results:
+            print(f"  Tracker CPU: {results['cpu_seconds']:.2f}s total")
+        if "rss_max_mb" in results:
+            print(f"  Tracker RSS: {results['rss_max_mb']:.1f} MB peak")
+        if not psutil:
+            print("  (install psutil for sampled CPU and memory)")
+
+        return results
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Soak-test the high score tracker with simulated emulators.")
+    parser.add_argument("--instances", type=int, default=4, help="Number of simulated emulators")
+    parser.add_argument("--games", default="contra,donkey-kong",
+                        help=f"Comma-separated game profiles ({', '.join(GAME_PROFILES)})")
+    parser.add_argument("--rate", type=float, default=1.0, help="Scores per second per emulator")
+    parser.add_argument("--pattern", choices=BURST_PATTERNS, default="steady", help="Write pattern")
+    parser.add_argument("--burst-size", type=int, default=10, help="Records per burst for --pattern burst")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds each emulator writes for")
+    parser.add_argument("--drain", type=float, default=5.0, help="Seconds to wait for stragglers")
+    parser.add_argument("--late-after", type=float, default=2.0, help="Latency in seconds counted as late")
+    parser.add_argument("--work-dir", default=None, help="Directory for emulator files (default: temp)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for --pattern random")
+    parser.add_argument("--json", action="store_true", help="Also print results as JSON")
+    args = parser.parse_args()
+
+    games = [g.strip() for g in args.games.split(",") if g.strip()]
+    for game in games:
+        if game not in GAME_PROFILES:
+            parser.error(f"unknown game profile: {game}")
+
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="bizhawk_soak_")
+    print(f"📁 Emulator files: {work_dir}")
+
+    soak = SoakTest(
+        instances=args.instances,
+        games=games,
+        rate=args.rate,
+        pattern=args.pattern,
+        burst_size=max(1, args.burst_size),
+        duration=args.duration,
+        drain=args.drain,
+        late_after=args.late_after,
+        work_dir=work_dir,
+        seed=args.seed
+    )
+
+    try:
+        results = soak.run()
+    except KeyboardInterrupt:
+        print("\n\n⏹ Soak test stopped by user.")
+        sys.exit(0)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+    sys.exit(0 if results["lost"] == 0 and results["duplicated"] == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+RAM Dump Score Extractor
+Decodes scores, lives and game-over transitions from recorded per-frame RAM dumps.
+Features: Memory-mapped dumps, NumPy-vectorized BCD/binary decoding, and JSON Lines
+score events for auditing disputed runs or backfilling missed scores.
+
+A dump is a flat binary file of consecutive frames, each holding the console's
+system RAM (2KB for the NES) as read by memory.read_u8 in the Lua score modules.
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("Missing numpy package. Please install:")
+    print("pip install numpy")
+    sys.exit(1)
+
+
+NES_RAM_SIZE = 0x0800
+DEFAULT_CHUNK_FRAMES = 1 << 20
+
+SCORE_ENCODINGS = {
+    "u8": 1,
+    "u16le": 2,
+    "u16be": 2,
+    "bcd": None,
+}
+
+# Layouts mirroring modules/score/*.lua, used when game_mappings.json has no entry
+DEFAULT_LAYOUTS = {
+    "Contra": {
+        "game": "Contra (NES)",
+        "score_addrs": [0x07E2, 0x07E3],
+        "score_encoding": "u16le",
+        "score_multiplier": 100,
+        "lives_addr": 0x0032,
+        "game_over_addr": 0x0038,
+        "game_over_value": 1,
+        "capture_delay": 10,
+    },
+    "Donkey Kong": {
+        "game": "Donkey Kong (NES)",
+        "score_addrs": [0x0025, 0x0026, 0x0027],
+        "score_encoding": "bcd",
+        "score_multiplier": 1,
+        "lives_addr": None,
+        "game_over_addr": 0x0406,
+        "game_over_value": 1,
+        "capture_delay": 0,
+    },
+}
+
+
+def parse_address(value):
+    """Parse a RAM address written as "0x07E2" or an integer."""
+    if value is None:
+        return None
+    if isinstance(value, int):
+        return value
+    return int(str(value), 0)
+
+
+def layout_from_mapping(game_name, entry):
+    """Build a decode layout from a game_mappings.json entry."""
+    ram = entry.get("ram_mappings", {})
+    if "score" not in ram:
+        raise ValueError(f"No score address mapped for {game_name}")
+
+    encoding = ram.get("score_encoding", "u8")
+    if encoding not in SCORE_ENCODINGS:
+        raise ValueError(f"Unknown score encoding for {game_name}: {encoding}")
+
+    score_bytes = SCORE_ENCODINGS[encoding] or int(ram.get("score_bytes", 1))
+    score_start = parse_address(ram["score"])
+
+    return {
+        "game": entry.get("game", f"{game_name} ({entry.get('system', 'NES')})"),
+        "score_addrs": [score_start + i for i in range(score_bytes)],
+        "score_encoding": encoding,
+        "score_multiplier": int(ram.get("score_multiplier", 1)),
+        "lives_addr": parse_address(ram.get("lives")),
+        "game_over_addr": parse_address(ram.get("game_over")),
+        "game_over_value": int(ram.get("game_over_value", 1)),
+        "capture_delay": int(ram.get("capture_delay", 0)),
+    }
+
+
+def load_layout(game_name, mappings_path=None, frame_size=NES_RAM_SIZE):
+    """Find the decode layout for a game, preferring game_mappings.json.
+
+    Installs from before the Lua-matching addresses keep their old
+    game_mappings.json (bizhawk_tool.py never overwrites it), so a mapped
+    score outside the frame falls back to the built-in layout when there is one.
+    """
+    if mappings_path and Path(mappings_path).exists():
+        with open(mappings_path, 'r', encoding='utf-8') as f:
+            mappings = json.load(f)
+        entry = mappings.get("games", {}).get(game_name)
+        if entry:
+            layout = layout_from_mapping(game_name, entry)
+            if max(layout["score_addrs"]) < frame_size or game_name not in DEFAULT_LAYOUTS:
+                return layout
+            print(f"⚠ {game_name} score 0x{layout['score_addrs'][0]:04X} in {mappings_path} is outside "
+                  f"the {frame_size}-byte frame, using built-in layout. Update or remove "
+                  f"the {game_name} entry to match modules/score", file=sys.stderr)
+        else:
+            print(f"⚠ {game_name} not in {mappings_path}, using built-in layout", file=sys.stderr)
+
+    if game_name not in DEFAULT_LAYOUTS:
+        raise ValueError(f"No RAM layout known for {game_name}")
+    return dict(DEFAULT_LAYOUTS[game_name])
+
+
+def decode_scores(raw, encoding, multiplier):
+    """Decode a (frames, bytes) uint8 array into one score per frame.
+
+    BCD frames containing a nibble above 9 decode to -1.
+    """
+    raw = raw.astype(np.int64, copy=False)
+
+    if encoding == "u8":
+        scores = raw[:, 0]
+    elif encoding == "u16le":
+        scores = raw[:, 0] | (raw[:, 1] << 8)
+    elif encoding == "u16be":
+        scores = (raw[:, 0] << 8) | raw[:, 1]
+    else:
+        hi = raw >> 4
+        lo = raw & 0x0F
+        scores = np.zeros(raw.shape[0], dtype=np.int64)
+        for i in range(raw.shape[1]):
+            scores = scores * 100 + hi[:, i] * 10 + lo[:, i]
+        valid = ((hi <= 9) & (lo <= 9)).all(axis=1)
+        return np.where(valid, scores * multiplier, -1)
+
+    return scores * multiplier
+
+
+class RamDumpExtractor:
+    """Scans a memory-mapped RAM dump chunk by chunk and yields score events."""
+
+    def __init__(self, dump_path, layout, frame_size=NES_RAM_SIZE, header_size=0,
+                 chunk_frames=DEFAULT_CHUNK_FRAMES):
+        self.dump_path = Path(dump_path)
+        self.layout = layout
+        self.frame_size = frame_size
+        self.chunk_frames = chunk_frames
+
+        total_bytes = self.dump_path.stat().st_size - header_size
+        self.frame_count = total_bytes // frame_size
+        if total_bytes % frame_size:
+            print(f"⚠ Ignoring {total_bytes % frame_size} trailing bytes (partial frame)", file=sys.stderr)
+
+        self.frames = np.memmap(
+            self.dump_path,
+            dtype=np.uint8,
+            mode="r",
+            offset=header_size,
+            shape=(self.frame_count, frame_size)
+        )
+
+        for key in ("lives_addr", "game_over_addr"):
+            addr = layout.get(key)
+            if addr is not None and addr >= frame_size:
+                print(f"⚠ {key} 0x{addr:04X} is outside the {frame_size}-byte frame, skipping",
+                      file=sys.stderr)
+                layout[key] = None
+
+        if max(layout["score_addrs"]) >= frame_size:
+            raise ValueError(f"Score address 0x{max(layout['score_addrs']):04X} is outside "
+                             f"the {frame_size}-byte frame")
+
+    def scores_at(self, frame_indices):
+        """Decode the score at specific frames."""
+        raw = self.frames[frame_indices][:, self.layout["score_addrs"]]
+        return decode_scores(raw, self.layout["score_encoding"], self.layout["score_multiplier"])
+
+    def events(self, score_changes=False):
+        """Yield event dicts in frame order across the whole dump."""
+        layout = self.layout
+        lives_addr = layout["lives_addr"]
+        game_over_addr = layout["game_over_addr"]
+        last_frame = self.frame_count - 1
+
+        prev_score = None
+        prev_lives = None
+        prev_game_over = None
+
+        for start in range(0, self.frame_count, self.chunk_frames):
+            end = min(start + self.chunk_frames, self.frame_count)
+            chunk = self.frames[start:end]
+            found = []
+
+            scores = decode_scores(chunk[:, layout["score_addrs"]],
+                                   layout["score_encoding"], layout["score_multiplier"])
+
+            if score_changes:
+                changed = np.flatnonzero(np.diff(scores, prepend=scores[0] if prev_score is None else prev_score))
+                for i in changed:
+                    found.append((start + int(i), "score", int(scores[i]), None))
+
+            lives = None
+            if lives_addr is not None:
+                lives = chunk[:, lives_addr].astype(np.int16)
+                before = np.concatenate(([lives[0] if prev_lives is None else prev_lives], lives[:-1]))
+                for i in np.flatnonzero(lives < before):
+                    found.append((start + int(i), "life_lost", int(scores[i]), int(lives[i])))
+                prev_lives = lives[-1]
+
+            if game_over_addr is not None:
+                over = chunk[:, game_over_addr] == layout["game_over_value"]
+                before = np.concatenate(([False if prev_game_over is None else prev_game_over], over[:-1]))
+                onsets = np.flatnonzero(over & ~before)
+                if onsets.size:
+                    # Read the final score after the module's stabilization delay
+                    capture = np.minimum(start + onsets + layout["capture_delay"], last_frame)
+                    final_scores = self.scores_at(capture)
+                    for i, frame, score in zip(onsets, capture, final_scores):
+                        found.append((int(frame), "game_over", int(score),
+                                      None if lives is None else int(lives[i])))
+                prev_game_over = over[-1]
+
+            prev_score = scores[-1]
+
+            found.sort(key=lambda e: e[0])
+            for frame, event, score, event_lives in found:
+                record = {
+                    "frame": frame,
+                    "event": event,
+                    "game": layout["game"],
+                    "score": score,
+                }
+                if event_lives is not None:
+                    record["lives"] = event_lives
+                yield record
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Extract score events from recorded per-frame RAM dumps.")
+    parser.add_argument("dump", help="Path to the raw RAM dump (consecutive frames)")
+    parser.add_argument("--game", required=True, help='Game name as in game_mappings.json, e.g. "Contra"')
+    parser.add_argument("--mappings", default=None, help="Path to game_mappings.json")
+    parser.add_argument("--frame-size", type=lambda v: int(v, 0), default=NES_RAM_SIZE,
+                        help="Bytes per frame (default 0x800)")
+    parser.add_argument("--header-size", type=int, default=0, help="Bytes to skip at the start of the dump")
+    parser.add_argument("--chunk-frames", type=int, default=DEFAULT_CHUNK_FRAMES, help="Frames decoded per pass")
+    parser.add_argument("--score-changes", action="store_true", help="Also emit every frame the score changes")
+    parser.add_argument("--initials", default=None, help="Initials to attach to events for backfill")
+    parser.add_argument("--output", default=None, help="Write events here instead of stdout")
+    args = parser.parse_args()
+
+    try:
+        layout = load_layout(args.game, args.mappings, args.frame_size)
+        extractor = RamDumpExtractor(
+            args.dump,
+            layout,
+            frame_size=args.frame_size,
+            header_size=args.header_size,
+            chunk_frames=args.chunk_frames
+        )
+    except (IOError, ValueError) as e:
+        print(f"✗ Error opening dump: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    counts = {}
+    try:
+        for record in extractor.events(score_changes=args.score_changes):
+            if args.initials:
+                record["initials"] = args.initials
+            out.write(json.dumps(record) + "\n")
+            counts[record["event"]] = counts.get(record["event"], 0) + 1
+    finally:
+        if args.output:
+            out.close()
+
+    print(f"✓ Scanned {extractor.frame_count:,} frames of {args.dump}", file=sys.stderr)
+    for event, count in sorted(counts.items()):
+        print(f"  {event}: {count:,}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""
+Score Event Model
+Typed, compact representation of high score records moving through the tracker.
+Features: One-time normalization of Lua records, a binary codec for queues and
+archive files, and column-backed batches for replaying large numbers of events.
+"""
+
+import sys
+import json
+import struct
+import calendar
+from array import array
+from datetime import datetime, timezone
+
+
+# Slugs listed in modules/supported_games.json; api/submit_score.php only accepts
+# contra, donkey-kong, galaga and pacman and rejects the rest as an invalid game slug
+GAME_SLUGS = ("contra", "donkey-kong", "galaga", "pacman", "burgertime", "digdug")
+
+# Game names as written by the Lua modules, lowercased with the "(NES)" suffix removed
+GAME_NAME_SLUGS = {
+    "contra": "contra",
+    "donkey kong": "donkey-kong",
+    "galaga": "galaga",
+    "pac-man": "pacman",
+    "pacman": "pacman",
+    "burgertime": "burgertime",
+    "burger time": "burgertime",
+    "dig dug": "digdug",
+    "digdug": "digdug",
+}
+
+GAME_IDS = {slug: i for i, slug in enumerate(GAME_SLUGS)}
+CUSTOM_GAME_ID = 0xFF
+
+# timestamp, score, game id, initials length
+RECORD = struct.Struct("<qqBB")
+SCORE_MIN = -(1 << 63)
+SCORE_MAX = (1 << 63) - 1
+ARCHIVE_MAGIC = b"SEV1"
+ARCHIVE_HEADER = struct.Struct("<4sIB")
+
+
+_slug_cache = {}
+_day_epoch_cache = {}
+_day_prefix_cache = {}
+
+
+def game_slug_for(name):
+    """Map a game name such as "Donkey Kong (NES)" or a slug to its API slug."""
+    slug = _slug_cache.get(name)
+    if slug is not None:
+        return slug
+
+    key = str(name).strip().lower()
+    if key.endswith("(nes)"):
+        key = key[:-5].strip()
+    if key in GAME_NAME_SLUGS:
+        slug = GAME_NAME_SLUGS[key]
+    else:
+        slug = "".join(c if c.isalnum() else "-" for c in key)
+        slug = "-".join(part for part in slug.split("-") if part)
+
+    if len(_slug_cache) < 1024:
+        _slug_cache[name] = sys.intern(slug)
+    return slug
+
+
+def parse_timestamp(value):
+    """Parse a Lua ISO timestamp ("2025-07-29T12:34:56.000000Z") to epoch seconds."""
+    if value is None or value == "":
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        # Fast path for the fixed format written by get_iso_timestamp() in the Lua modules,
+        # the date part repeats across a session so its epoch is cached
+        day = value[:10]
+        day_epoch = _day_epoch_cache.get(day)
+        if day_epoch is None:
+            day_epoch = calendar.timegm((int(value[0:4]), int(value[5:7]), int(value[8:10]), 0, 0, 0, 0, 0, 0))
+            if len(_day_epoch_cache) < 4096:
+                _day_epoch_cache[day] = day_epoch
+        if value[10] != "T" or value[-1] != "Z":
+            raise ValueError(value)
+        return day_epoch + int(value[11:13]) * 3600 + int(value[14:16]) * 60 + int(value[17:19])
+    except (ValueError, IndexError, TypeError):
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return int(parsed.timestamp())
+
+
+def format_timestamp(epoch):
+    """Format epoch seconds the way the Lua modules do."""
+    day, seconds = divmod(epoch, 86400)
+    prefix = _day_prefix_cache.get(day)
+    if prefix is None:
+        prefix = datetime.fromtimestamp(day * 86400, timezone.utc).strftime("%Y-%m-%dT")
+        if len(_day_prefix_cache) < 4096:
+            _day_prefix_cache[day] = prefix
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    return f"{prefix}{hours:02d}:{minutes:02d}:{seconds:02d}.000000Z"
+
+
+class ScoreEvent:
+    """A single normalized high score."""
+
+    __slots__ = ("game_slug", "initials", "score", "timestamp")
+
+    def __init__(self, game_slug, initials, score, timestamp=0):
+        self.game_slug = game_slug
+        self.initials = initials
+        self.score = score
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_record(cls, record):
+        """Normalize a record from any score module.
+
+        Donkey Kong writes every value as a string, Contra writes the score as
+        a number, and web submissions use player_name and game_slug.
+        """
+        if not isinstance(record, dict):
+            raise ValueError(f"Score record must be a JSON object, got {type(record).__name__}")
+
+        if record.get("game_slug"):
+            game_slug = game_slug_for(record["game_slug"])
+        elif record.get("game"):
+            game_slug = game_slug_for(record["game"])
+        else:
+            raise ValueError("Score record has no game")
+
+        initials = record.get("initials") or record.get("player_name")
+        if not initials:
+            raise ValueError("Score record has no initials")
+
+        score = record.get("score", 0)
+        if score.__class__ is not int:
+            try:
+                try:
+                    score = int(score)
+                except ValueError:
+                    score = int(float(score))
+            except OverflowError:
+                raise ValueError(f"Score out of range: {score!r}") from None
+        # encode() packs the score as a signed 64-bit integer
+        if not SCORE_MIN <= score <= SCORE_MAX:
+            raise ValueError(f"Score out of range: {score!r}")
+
+        return cls(
+            game_slug,
+            str(initials).strip(),
+            score,
+            parse_timestamp(record.get("timestamp"))
+        )
+
+    @classmethod
+    def from_json_line(cls, line):
+        """Parse one line of highscores.jsonl."""
+        return cls.from_record(json.loads(line))
+
+    def to_payload(self):
+        """Build the JSON body expected by api/submit_score.php."""
+        return {
+            "game_slug": self.game_slug,
+            "initials": self.initials,
+            "score": self.score,
+            "timestamp": format_timestamp(self.timestamp),
+        }
+
+    def encode(self):
+        """Encode to compact bytes for queues."""
+        initials = self.initials.encode("utf-8")
+        game_id = GAME_IDS.get(self.game_slug)
+        if game_id is not None:
+            return RECORD.pack(self.timestamp, self.score, game_id, len(initials)) + initials
+
+        slug = self.game_slug.encode("utf-8")
+        return (RECORD.pack(self.timestamp, self.score, CUSTOM_GAME_ID, len(initials))
+                + initials + bytes((len(slug),)) + slug)
+
+    @classmethod
+    def decode(cls, data, offset=0):
+        """Decode bytes produced by encode()."""
+        timestamp, score, game_id, initials_len = RECORD.unpack_from(data, offset)
+        pos = offset + RECORD.size
+        initials = bytes(data[pos:pos + initials_len]).decode("utf-8")
+        pos += initials_len
+        if game_id == CUSTOM_GAME_ID:
+            slug_len = data[pos]
+            game_slug = sys.intern(bytes(data[pos + 1:pos + 1 + slug_len]).decode("utf-8"))
+        else:
+            game_slug = GAME_SLUGS[game_id]
+        return cls(game_slug, initials, score, timestamp)
+
+    def __eq__(self, other):
+        if not isinstance(other, ScoreEvent):
+            return NotImplemented
+        return (self.game_slug, self.initials, self.score, self.timestamp) == \
+               (other.game_slug, other.initials, other.score, other.timestamp)
+
+    def __repr__(self):
+        return (f"ScoreEvent(game_slug={self.game_slug!r}, initials={self.initials!r}, "
+                f"score={self.score}, timestamp={self.timestamp})")
+
+
+class ScoreEventBatch:
+    """Column-backed collection of score events.
+
+    Keeps timestamps, scores and game ids in typed arrays so large replays
+    hold a handful of objects instead of one dict per event.
+    """
+
+    def __init__(self):
+        self.slugs = list(GAME_SLUGS)
+        self.slug_ids = {slug: i for i, slug in enumerate(self.slugs)}
+        self.timestamps = array("q")
+        self.scores = array("q")
+        self.game_ids = array("B")
+        self.initials = []
+
+    def __len__(self):
+        return len(self.scores)
+
+    def __iter__(self):
+        for i in range(len(self.scores)):
+            yield self[i]
+
+    def __getitem__(self, i):
+        return ScoreEvent(self.slugs[self.game_ids[i]], self.initials[i], self.scores[i], self.timestamps[i])
+
+    def _game_id(self, game_slug):
+        game_id = self.slug_ids.get(game_slug)
+        if game_id is None:
+            if len(self.slugs) >= CUSTOM_GAME_ID:
+                raise ValueError("Too many distinct games in one batch")
+            game_id = len(self.slugs)
+            self.slugs.append(game_slug)
+            self.slug_ids[game_slug] = game_id
+        return game_id
+
+    def append(self, event):
+        self.timestamps.append(event.timestamp)
+        self.scores.append(event.score)
+        self.game_ids.append(self._game_id(event.game_slug))
+        self.initials.append(sys.intern(event.initials))
+
+    def extend_json_lines(self, lines):
+        """Parse and append highscores.jsonl lines, skipping blank ones."""
+        for line in lines:
+            if line.strip():
+                self.append(ScoreEvent.from_json_line(line))
+
+    def to_payloads(self):
+        """Build a list of API payloads, e.g. for a batch HTTP request."""
+        return [event.to_payload() for event in self]
+
+    def encode(self):
+        """Encode the whole batch to bytes for archive files."""
+        columns = [self.timestamps, self.scores]
+        if sys.byteorder == "big":
+            columns = [array(c.typecode, c) for c in columns]
+            for column in columns:
+                column.byteswap()
+
+        initials = [s.encode("utf-8") for s in self.initials]
+        slugs = [s.encode("utf-8") for s in self.slugs]
+        parts = [ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, len(self), len(slugs))]
+        parts.extend(bytes((len(s),)) + s for s in slugs)
+        parts.extend(column.tobytes() for column in columns)
+        parts.append(self.game_ids.tobytes())
+        parts.append(bytes(len(s) for s in initials))
+        parts.extend(initials)
+        return b"".join(parts)
+
+    @classmethod
+    def decode(cls, data):
+        """Decode bytes produced by encode()."""
+        magic, count, slug_count = ARCHIVE_HEADER.unpack_from(data, 0)
+        if magic != ARCHIVE_MAGIC:
+            raise ValueError("Not a score event archive")
+
+        batch = cls()
+        view = memoryview(data)
+        pos = ARCHIVE_HEADER.size
+
+        batch.slugs = []
+        for _ in range(slug_count):
+            length = view[pos]
+            batch.slugs.append(sys.intern(bytes(view[pos + 1:pos + 1 + length]).decode("utf-8")))
+            pos += 1 + length
+        batch.slug_ids = {slug: i for i, slug in enumerate(batch.slugs)}
+
+        for name in ("timestamps", "scores"):
+            column = getattr(batch, name)
+            size = count * column.itemsize
+            column.frombytes(view[pos:pos + size])
+            if sys.byteorder == "big":
+                column.byteswap()
+            pos += size
+
+        batch.game_ids.frombytes(view[pos:pos + count])
+        pos += count
+
+        lengths = view[pos:pos + count]
+        pos += count
+        for length in lengths:
+            batch.initials.append(sys.intern(bytes(view[pos:pos + length]).decode("utf-8")))
+            pos += length
+
+        return batch
+
+    def write_archive(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.encode())
+
+    @classmethod
+    def read_archive(cls, path):
+        with open(path, 'rb') as f:
+            return cls.decode(f.read())
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Score Rollup Builder
+Maintains per-game, per-day top-K score buckets in highscores.db for windowed leaderboards.
+Features: Daily buckets kept current by insert, update and delete triggers, rolling
+day/week/month windows merged from buckets, and the same query used by
+api/get_scores.php?window=...
+"""
+
+import sys
+import time
+import sqlite3
+import argparse
+from pathlib import Path
+from datetime import date, timedelta
+
+
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "data" / "highscores.db"
+
+# Scores kept per game per day; matches the max limit of api/get_scores.php
+TOP_K = 100
+
+# Rolling windows as days before today, must match api/get_scores.php
+WINDOWS = {
+    "day": 0,
+    "week": 6,
+    "month": 29,
+}
+
+# Trigger bodies that add a high_scores row (NEW) to, or remove one (OLD) from, its bucket
+BUCKET_ADD = f"""
+        INSERT INTO score_bucket_counts (game_slug, bucket_day, total)
+        VALUES (NEW.game_slug, NEW.date_achieved, 1)
+        ON CONFLICT (game_slug, bucket_day) DO UPDATE SET total = total + 1;
+
+        -- OR IGNORE: on update the removal refill may already have bucketed the new row
+        INSERT OR IGNORE INTO score_buckets
+            (game_slug, bucket_day, score_id, player_name, score, level_reached, date_achieved, created_at)
+        SELECT NEW.game_slug, NEW.date_achieved, NEW.id, NEW.player_name, NEW.score,
+               NEW.level_reached, NEW.date_achieved, NEW.created_at
+        WHERE (
+            SELECT COUNT(*) FROM score_buckets
+            WHERE game_slug = NEW.game_slug AND bucket_day = NEW.date_achieved
+        ) < {TOP_K} OR NEW.score > (
+            SELECT MIN(score) FROM score_buckets
+            WHERE game_slug = NEW.game_slug AND bucket_day = NEW.date_achieved
+        );
+
+        DELETE FROM score_buckets
+        WHERE game_slug = NEW.game_slug AND bucket_day = NEW.date_achieved
+        AND score_id NOT IN (
+            SELECT score_id FROM score_buckets
+            WHERE game_slug = NEW.game_slug AND bucket_day = NEW.date_achieved
+            ORDER BY score DESC, score_id ASC
+            LIMIT {TOP_K}
+        );
+"""
+
+BUCKET_REMOVE = """
+        UPDATE score_bucket_counts SET total = total - 1
+        WHERE game_slug = OLD.game_slug AND bucket_day = OLD.date_achieved;
+
+        DELETE FROM score_buckets
+        WHERE game_slug = OLD.game_slug AND bucket_day = OLD.date_achieved AND score_id = OLD.id;
+
+        -- Refill with the best remaining score that is not already bucketed
+        INSERT OR IGNORE INTO score_buckets
+            (game_slug, bucket_day, score_id, player_name, score, level_reached, date_achieved, created_at)
+        SELECT hs.game_slug, hs.date_achieved, hs.id, hs.player_name, hs.score,
+               hs.level_reached, hs.date_achieved, hs.created_at
+        FROM high_scores hs
+        WHERE changes() > 0
+        AND hs.game_slug = OLD.game_slug AND hs.date_achieved = OLD.date_achieved
+        AND hs.id NOT IN (
+            SELECT score_id FROM score_buckets
+            WHERE game_slug = OLD.game_slug AND bucket_day = OLD.date_achieved
+        )
+        ORDER BY hs.score DESC, hs.id ASC
+        LIMIT 1;
+"""
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS score_buckets (
+        game_slug VARCHAR(50) NOT NULL,
+        bucket_day DATE NOT NULL,
+        score_id INTEGER NOT NULL,
+        player_name VARCHAR(50) NOT NULL,
+        score INTEGER NOT NULL,
+        level_reached VARCHAR(20),
+        date_achieved DATE NOT NULL,
+        created_at DATETIME,
+        PRIMARY KEY (game_slug, bucket_day, score_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_bucket_day_score ON score_buckets(bucket_day, score DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_bucket_score ON score_buckets(score DESC)",
+    """
+    CREATE TABLE IF NOT EXISTS score_bucket_counts (
+        game_slug VARCHAR(50) NOT NULL,
+        bucket_day DATE NOT NULL,
+        total INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (game_slug, bucket_day)
+    )
+    """,
+    # Lets a bucket refill from high_scores when one of its scores is deleted
+    "CREATE INDEX IF NOT EXISTS idx_game_date_score ON high_scores(game_slug, date_achieved, score DESC)",
+    f"CREATE TRIGGER IF NOT EXISTS high_scores_rollup_ai AFTER INSERT ON high_scores BEGIN{BUCKET_ADD}    END",
+    f"CREATE TRIGGER IF NOT EXISTS high_scores_rollup_ad AFTER DELETE ON high_scores BEGIN{BUCKET_REMOVE}    END",
+    # An edited score leaves its old bucket and joins its new one, which may be the same bucket
+    f"""CREATE TRIGGER IF NOT EXISTS high_scores_rollup_au
+    AFTER UPDATE OF id, game_slug, player_name, score, level_reached, date_achieved, created_at ON high_scores
+    BEGIN{BUCKET_REMOVE}{BUCKET_ADD}    END""",
+]
+
+
+def window_start(window, today=None):
+    """First bucket day included in a rolling window."""
+    today = today or date.today()
+    return (today - timedelta(days=WINDOWS[window])).isoformat()
+
+
+class ScoreRollup:
+    """Daily top-K buckets stored alongside the scores in highscores.db."""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+
+    def close(self):
+        self.conn.close()
+
+    def create(self):
+        """Create the bucket tables and triggers."""
+        with self.conn:
+            for statement in SCHEMA:
+                self.conn.execute(statement)
+
+    def rebuild(self):
+        """Recompute every bucket from high_scores."""
+        with self.conn:
+            self.conn.execute("DELETE FROM score_buckets")
+            self.conn.execute("DELETE FROM score_bucket_counts")
+            self.conn.execute("""
+                INSERT INTO score_bucket_counts (game_slug, bucket_day, total)
+                SELECT game_slug, date_achieved, COUNT(*) FROM high_scores
+                GROUP BY game_slug, date_achieved
+            """)
+            self.conn.execute(f"""
+                INSERT INTO score_buckets
+                    (game_slug, bucket_day, score_id, player_name, score, level_reached, date_achieved, created_at)
+                SELECT game_slug, date_achieved, id, player_name, score, level_reached, date_achieved, created_at
+                FROM (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY game_slug, date_achieved
+                        ORDER BY score DESC, id ASC
+                    ) AS bucket_rank
+                    FROM high_scores
+                )
+                WHERE bucket_rank <= {TOP_K}
+            """)
+
+        return self.conn.execute(
+            "SELECT COUNT(*) AS buckets, COALESCE(SUM(total), 0) AS scores FROM score_bucket_counts"
+        ).fetchone()
+
+    def leaderboard(self, window, game_slug=None, limit=50, offset=0, today=None):
+        """Top scores for a rolling window, merged from its daily buckets."""
+        params = [window_start(window, today)]
+        where = "bucket_day >= ?"
+        if game_slug:
+            where += " AND game_slug = ?"
+            params.append(game_slug)
+
+        # Buckets only hold the top K of each day, so deeper pages are not available
+        limit = max(0, min(limit, TOP_K - offset))
+
+        rows = self.conn.execute(
+            f"""
+            SELECT score_id AS id, game_slug, player_name, score, level_reached, date_achieved, created_at
+            FROM score_buckets
+            WHERE {where}
+            ORDER BY score DESC, date_achieved ASC
+            LIMIT ? OFFSET ?
+            """,
+            (*params, limit, offset)
+        ).fetchall()
+
+        total = self.conn.execute(
+            f"SELECT COALESCE(SUM(total), 0) FROM score_bucket_counts WHERE {where}",
+            params
+        ).fetchone()[0]
+
+        return [dict(row) for row in rows], total
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build and query daily/weekly/monthly leaderboard buckets.")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="Path to highscores.db")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("build", help="Create bucket tables and triggers, then rebuild all buckets")
+
+    show_parser = subparsers.add_parser("show", help="Print a windowed leaderboard")
+    show_parser.add_argument("window", choices=list(WINDOWS), help="Rolling window")
+    show_parser.add_argument("--game", default=None, help="Game slug")
+    show_parser.add_argument("--limit", type=int, default=10, help="Number of scores")
+
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"✗ Database not found: {args.db}")
+        sys.exit(1)
+
+    rollup = ScoreRollup(args.db)
+    try:
+        if args.command == "build":
+            print(f"🔧 Building score buckets in {args.db}...")
+            start = time.perf_counter()
+            rollup.create()
+            summary = rollup.rebuild()
+            print(f"✓ Score buckets built in {(time.perf_counter() - start) * 1000:.1f} ms")
+            print(f"  Buckets: {summary['buckets']:,}")
+            print(f"  Scores:  {summary['scores']:,}")
+        else:
+            start = time.perf_counter()
+            rows, total = rollup.leaderboard(args.window, args.game, args.limit)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"🏆 Top scores this {args.window}" + (f" for {args.game}" if args.game else ""))
+            for rank, row in enumerate(rows, 1):
+                print(f"  {rank:>3}. {row['player_name']:<20} {row['score']:>12,}  "
+                      f"{row['game_slug']:<12} {row['date_achieved']}")
+            print(f"✓ {len(rows)} of {total:,} scores in {elapsed:.2f} ms")
+    except sqlite3.OperationalError as e:
+        print(f"✗ Score rollup error: {e}")
+        sys.exit(1)
+    finally:
+        rollup.close()
+
+
+if __name__ == "__main__":
+    main()
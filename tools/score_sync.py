@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Score Sync Agent
+Ships new high scores from this site's SQLite database to one or more central nodes.
+Features: Per-peer high-water marks, gzip-compressed batches, and idempotency keys.
+"""
+
+import os
+import sys
+import json
+import gzip
+import time
+import sqlite3
+import hashlib
+import argparse
+from pathlib import Path
+
+try:
+    import requests
+except ImportError:
+    print("Missing requests package. Please install:")
+    print("pip install requests")
+    sys.exit(1)
+
+
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "data" / "highscores.db"
+DEFAULT_BATCH_SIZE = 500
+
+
+def score_idempotency_key(site_id, row):
+    """Build the content-derived idempotency key for a score row.
+
+    Must match buildIdempotencyKey() in api/sync_scores.php. The key leaves out
+    the row id and created_at, so identical scores from the same site, player
+    and day collapse into one row on the central node.
+    """
+    level = row["level_reached"]
+    parts = [
+        site_id,
+        row["game_slug"],
+        row["player_name"],
+        str(int(row["score"])),
+        "" if level is None else str(level),
+        row["date_achieved"],
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class ScoreSyncAgent:
+    """Delta-syncs high_scores rows to central nodes, one high-water mark per peer."""
+
+    def __init__(self, site_id, peers, secret, db_path=DEFAULT_DB_PATH, state_path=None,
+                 batch_size=DEFAULT_BATCH_SIZE):
+        self.site_id = site_id
+        self.secret = secret
+        self.peers = peers
+        self.db_path = Path(db_path)
+        self.state_path = Path(state_path) if state_path else self.db_path.with_name("sync_state.json")
+        self.batch_size = batch_size
+        self.session = requests.Session()
+
+    def load_state(self):
+        """Load per-peer high-water marks from the state file."""
+        if not self.state_path.exists():
+            return {"peers": {}}
+
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            state.setdefault("peers", {})
+            return state
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"⚠ Could not read sync state, starting from scratch: {e}")
+            return {"peers": {}}
+
+    def save_state(self, state):
+        """Atomically write per-peer high-water marks to the state file."""
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def fetch_batch(self, conn, after_id):
+        """Fetch the next batch of rows with an id above the high-water mark."""
+        cursor = conn.execute(
+            """
+            SELECT id, game_slug, player_name, score, level_reached, date_achieved, created_at
+            FROM high_scores
+            WHERE id > ?
+            ORDER BY id ASC
+            LIMIT ?
+            """,
+            (after_id, self.batch_size)
+        )
+        return cursor.fetchall()
+
+    def encode_batch(self, rows):
+        """Serialize a batch of rows to a gzip-compressed JSON payload."""
+        payload = {
+            "site_id": self.site_id,
+            "rows": [
+                {
+                    "id": row["id"],
+                    "game_slug": row["game_slug"],
+                    "player_name": row["player_name"],
+                    "score": row["score"],
+                    "level_reached": row["level_reached"],
+                    "date_achieved": row["date_achieved"],
+                    "created_at": row["created_at"],
+                    "idempotency_key": score_idempotency_key(self.site_id, row),
+                }
+                for row in rows
+            ],
+        }
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return gzip.compress(body, compresslevel=6)
+
+    def send_batch(self, peer_url, body):
+        """POST a compressed batch to a peer and return the response data."""
+        response = self.session.post(
+            peer_url,
+            data=body,
+            headers={
+                "Content-Type": "application/json",
+                "Content-Encoding": "gzip",
+                "X-Sync-Secret": self.secret,
+            },
+            timeout=30
+        )
+        response.raise_for_status()
+        result = response.json()
+        if not result.get("success"):
+            raise requests.RequestException(result.get("error", "Unknown error"))
+        return result["data"]
+
+    def sync_peer(self, conn, peer_url, state):
+        """Ship every row above the peer's high-water mark, batch by batch.
+
+        The mark only advances after the peer acknowledges a batch, so a failed
+        or interrupted run resumes where it left off and replays are deduped
+        by the receiver's idempotency keys.
+        """
+        high_water_mark = int(state["peers"].get(peer_url, 0))
+        totals = {"sent": 0, "accepted": 0, "duplicates": 0, "rejected": 0}
+
+        print(f"🌐 Syncing to {peer_url} (after id {high_water_mark})")
+
+        while True:
+            rows = self.fetch_batch(conn, high_water_mark)
+            if not rows:
+                break
+
+            body = self.encode_batch(rows)
+            try:
+                result = self.send_batch(peer_url, body)
+            except (requests.RequestException, ValueError) as e:
+                print(f"✗ Batch failed, will retry from id {high_water_mark}: {e}")
+                return False, totals
+
+            high_water_mark = rows[-1]["id"]
+            state["peers"][peer_url] = high_water_mark
+            self.save_state(state)
+
+            totals["sent"] += len(rows)
+            totals["accepted"] += result.get("accepted", 0)
+            totals["duplicates"] += result.get("duplicates", 0)
+            totals["rejected"] += len(result.get("rejected", []))
+
+            print(f"  ✓ {len(rows)} rows ({len(body)} bytes) up to id {high_water_mark}: "
+                  f"{result.get('accepted', 0)} new, {result.get('duplicates', 0)} duplicate")
+
+            if len(rows) < self.batch_size:
+                break
+
+        return True, totals
+
+    def run_once(self):
+        """Sync all peers once. Returns True if every peer caught up."""
+        if not self.db_path.exists():
+            print(f"✗ Database not found: {self.db_path}")
+            return False
+
+        state = self.load_state()
+        all_ok = True
+
+        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        try:
+            for peer_url in self.peers:
+                ok, totals = self.sync_peer(conn, peer_url, state)
+                all_ok = all_ok and ok
+                print(f"📊 {peer_url}: {totals['sent']} sent, {totals['accepted']} new, "
+                      f"{totals['duplicates']} duplicate, {totals['rejected']} rejected")
+        finally:
+            conn.close()
+
+        return all_ok
+
+    def run_forever(self, interval):
+        """Sync all peers every interval seconds."""
+        print(f"🚀 Score sync agent started for site '{self.site_id}' (every {interval}s)")
+        while True:
+            self.run_once()
+            time.sleep(interval)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Ship new high scores to central leaderboard nodes.")
+    parser.add_argument("--site-id", required=True, help="Unique identifier for this arcade site")
+    parser.add_argument("--peer", action="append", required=True,
+                        help="Central node sync URL, e.g. http://central/api/sync_scores.php (repeatable)")
+    parser.add_argument("--secret", default=os.environ.get("SCORE_SYNC_SECRET"),
+                        help="Shared secret configured for this site on the peers (default: $SCORE_SYNC_SECRET)")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="Path to the site's highscores.db")
+    parser.add_argument("--state", default=None, help="Path to the high-water mark state file")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per batch")
+    parser.add_argument("--interval", type=int, default=0,
+                        help="Seconds between runs; 0 syncs once and exits")
+    args = parser.parse_args()
+
+    if not args.secret:
+        parser.error("a sync secret is required (--secret or SCORE_SYNC_SECRET)")
+
+    agent = ScoreSyncAgent(
+        args.site_id,
+        args.peer,
+        args.secret,
+        db_path=args.db,
+        state_path=args.state,
+        batch_size=args.batch_size
+    )
+
+    try:
+        if args.interval > 0:
+            agent.run_forever(args.interval)
+        else:
+            sys.exit(0 if agent.run_once() else 1)
+    except KeyboardInterrupt:
+        print("\n\n⏹ Sync agent stopped by user.")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
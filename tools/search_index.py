@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Search Index Builder
+Builds an autocomplete index over player names and game metadata in highscores.db.
+Features: Prefix lookups on a NOCASE index, FTS5 trigram fallback for substrings,
+and incremental refreshes that pick up new scores and games without touching the
+high_scores write path.
+"""
+
+import sys
+import time
+import sqlite3
+import argparse
+from pathlib import Path
+
+
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "data" / "highscores.db"
+
+# Upper bound appended to a prefix for NOCASE range scans
+PREFIX_END = chr(0x10FFFF)
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS search_entries (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        kind VARCHAR(10) NOT NULL,
+        label VARCHAR(100) NOT NULL COLLATE NOCASE,
+        game_slug VARCHAR(50),
+        weight INTEGER NOT NULL DEFAULT 0,
+        UNIQUE (kind, label)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_search_label ON search_entries(label)",
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+        label,
+        content='search_entries',
+        content_rowid='id',
+        tokenize='trigram'
+    )
+    """,
+    # Keep the FTS table in step with search_entries
+    """
+    CREATE TRIGGER IF NOT EXISTS search_entries_ai AFTER INSERT ON search_entries BEGIN
+        INSERT INTO search_fts (rowid, label) VALUES (NEW.id, NEW.label);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_entries_ad AFTER DELETE ON search_entries BEGIN
+        INSERT INTO search_fts (search_fts, rowid, label) VALUES ('delete', OLD.id, OLD.label);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS search_entries_au AFTER UPDATE OF label ON search_entries BEGIN
+        INSERT INTO search_fts (search_fts, rowid, label) VALUES ('delete', OLD.id, OLD.label);
+        INSERT INTO search_fts (rowid, label) VALUES (NEW.id, NEW.label);
+    END
+    """,
+    # Last high_scores.id folded into the index by rebuild() or refresh()
+    """
+    CREATE TABLE IF NOT EXISTS search_state (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        last_score_id INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    "INSERT OR IGNORE INTO search_state (id, last_score_id) VALUES (1, 0)",
+    # Triggers on high_scores and games would make every PHP insert depend on FTS5
+    # support in PHP's SQLite, so indexes built by older versions lose them
+    "DROP TRIGGER IF EXISTS high_scores_search_ai",
+    "DROP TRIGGER IF EXISTS games_search_ai",
+]
+
+
+class SearchIndex:
+    """Autocomplete index stored alongside the scores in highscores.db."""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+
+    def close(self):
+        self.conn.close()
+
+    def create(self):
+        """Create the index tables and triggers."""
+        with self.conn:
+            for statement in SCHEMA:
+                self.conn.execute(statement)
+
+    def rebuild(self):
+        """Rebuild every entry from the games and high_scores tables."""
+        with self.conn:
+            self.conn.execute("DELETE FROM search_entries")
+            self.conn.execute(
+                "UPDATE search_state SET last_score_id = (SELECT COALESCE(MAX(id), 0) FROM high_scores)"
+            )
+            self.conn.execute("""
+                INSERT INTO search_entries (kind, label, game_slug, weight)
+                SELECT 'game', name, slug, 0 FROM games
+            """)
+            self.conn.execute("""
+                INSERT OR IGNORE INTO search_entries (kind, label, game_slug, weight)
+                SELECT DISTINCT 'developer', developer, NULL, 0 FROM games WHERE developer IS NOT NULL
+            """)
+            self.conn.execute("""
+                INSERT INTO search_entries (kind, label, weight)
+                SELECT 'player', player_name, COUNT(*) FROM high_scores
+                GROUP BY player_name COLLATE NOCASE
+            """)
+            # Game weight is its score count so busy games rank first
+            self.conn.execute("""
+                UPDATE search_entries SET weight = (
+                    SELECT COUNT(*) FROM high_scores WHERE high_scores.game_slug = search_entries.game_slug
+                ) WHERE kind = 'game'
+            """)
+            self.conn.execute("INSERT INTO search_fts (search_fts) VALUES ('rebuild')")
+            self.conn.execute("INSERT INTO search_fts (search_fts) VALUES ('optimize')")
+
+        return self.conn.execute("SELECT kind, COUNT(*) FROM search_entries GROUP BY kind").fetchall()
+
+    def refresh(self):
+        """Fold scores and games added since the last rebuild or refresh into the index.
+
+        Only rows with an id above last_score_id are seen, so deleted scores,
+        renamed players and moved scores keep their old entries and weights
+        until the next rebuild(). Returns the number of new scores indexed.
+        """
+        with self.conn:
+            last_id = self.conn.execute("SELECT last_score_id FROM search_state WHERE id = 1").fetchone()[0]
+            max_id = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM high_scores").fetchone()[0]
+
+            self.conn.execute("""
+                INSERT OR IGNORE INTO search_entries (kind, label, game_slug, weight)
+                SELECT 'game', name, slug, 0 FROM games
+            """)
+            self.conn.execute("""
+                INSERT OR IGNORE INTO search_entries (kind, label, game_slug, weight)
+                SELECT DISTINCT 'developer', developer, NULL, 0 FROM games WHERE developer IS NOT NULL
+            """)
+
+            if max_id <= last_id:
+                return 0
+
+            self.conn.execute("""
+                INSERT INTO search_entries (kind, label, weight)
+                SELECT 'player', player_name, COUNT(*) FROM high_scores
+                WHERE id > ? AND id <= ?
+                GROUP BY player_name COLLATE NOCASE
+                ON CONFLICT (kind, label) DO UPDATE SET weight = weight + excluded.weight
+            """, (last_id, max_id))
+            self.conn.execute("""
+                UPDATE search_entries SET weight = weight + (
+                    SELECT COUNT(*) FROM high_scores
+                    WHERE high_scores.game_slug = search_entries.game_slug AND id > ? AND id <= ?
+                ) WHERE kind = 'game'
+            """, (last_id, max_id))
+            self.conn.execute("UPDATE search_state SET last_score_id = ? WHERE id = 1", (max_id,))
+
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM high_scores WHERE id > ? AND id <= ?", (last_id, max_id)
+            ).fetchone()[0]
+
+    def suggest(self, query, limit=10):
+        """Return up to limit entries whose label starts with, then contains, the query."""
+        query = query.strip()
+        if not query:
+            return []
+
+        rows = self.conn.execute(
+            """
+            SELECT id, kind, label, game_slug, weight FROM search_entries
+            WHERE label >= ? AND label < ?
+            ORDER BY label
+            LIMIT ?
+            """,
+            (query, query + PREFIX_END, limit)
+        ).fetchall()
+
+        # Trigram matching needs at least three characters
+        if len(rows) < limit and len(query) >= 3:
+            seen = {row["id"] for row in rows}
+            phrase = '"' + query.replace('"', '""') + '"'
+            # Prefix hits also match as substrings, so limit rows always leaves enough new ones
+            matches = self.conn.execute(
+                """
+                SELECT e.id, e.kind, e.label, e.game_slug, e.weight
+                FROM search_fts
+                JOIN search_entries e ON e.id = search_fts.rowid
+                WHERE search_fts MATCH ?
+                ORDER BY e.weight DESC
+                LIMIT ?
+                """,
+                (phrase, limit)
+            ).fetchall()
+            rows += [row for row in matches if row["id"] not in seen][:limit - len(rows)]
+
+        return [dict(row) for row in rows]
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build and query the player and game search index.")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="Path to highscores.db")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("build", help="Create the index, then rebuild all entries")
+    refresh_parser = subparsers.add_parser(
+        "refresh",
+        help="Index scores and games added since the last run; deleted or edited scores "
+             "are only dropped by a periodic build"
+    )
+    refresh_parser.add_argument("--interval", type=int, default=0,
+                                help="Seconds between refreshes; 0 refreshes once and exits")
+
+    query_parser = subparsers.add_parser("query", help="Show autocomplete suggestions")
+    query_parser.add_argument("text", help="Search text")
+    query_parser.add_argument("--limit", type=int, default=10, help="Maximum suggestions")
+
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"✗ Database not found: {args.db}")
+        sys.exit(1)
+
+    index = SearchIndex(args.db)
+    try:
+        if args.command == "build":
+            print(f"🔧 Building search index in {args.db}...")
+            start = time.perf_counter()
+            index.create()
+            counts = index.rebuild()
+            print(f"✓ Search index built in {(time.perf_counter() - start) * 1000:.1f} ms")
+            for kind, count in counts:
+                print(f"  {kind}: {count:,}")
+        elif args.command == "refresh":
+            index.create()
+            while True:
+                start = time.perf_counter()
+                added = index.refresh()
+                print(f"✓ Indexed {added:,} new scores in {(time.perf_counter() - start) * 1000:.1f} ms")
+                if args.interval <= 0:
+                    break
+                time.sleep(args.interval)
+        else:
+            start = time.perf_counter()
+            results = index.suggest(args.text, args.limit)
+            elapsed = (time.perf_counter() - start) * 1000
+            for result in results:
+                print(f"  [{result['kind']}] {result['label']} ({result['weight']})")
+            print(f"✓ {len(results)} suggestions in {elapsed:.2f} ms")
+    except KeyboardInterrupt:
+        print("\n⏹ Search index refresh stopped by user.")
+    except sqlite3.OperationalError as e:
+        print(f"✗ Search index error: {e}")
+        print("  FTS5 with the trigram tokenizer requires SQLite 3.34+")
+        sys.exit(1)
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()